@@ -29,6 +29,16 @@ LUMINARIES = [swe.SUN, swe.MOON]
 # 感受点
 SENSITIVE_POINTS = ["ASC", "MC", "PoF"]
 
+# ハウスシステム
+HOUSE_SYSTEMS = {
+    "プラシーダス": b'P', "コッホ": b'K', "ホールサイン": b'W',
+    "イコール": b'E', "レギオモンタヌス": b'R', "キャンパナス": b'C'
+}
+# 天体のハウス判定に使うハウスシステム
+PRIMARY_HOUSE_SYSTEM = "プラシーダス"
+# 計算できなかった場合（高緯度など）に順に試すハウスシステム
+HOUSE_FALLBACK_ORDER = ["レギオモンタヌス", "イコール", "ホールサイン"]
+
 # アスペクト定義（メジャーアスペクト）
 MAJOR_ASPECTS = {
     "コンジャンクション (0度)": {"angle": 0, "orb_lum": 8, "orb_other": 5},
@@ -119,9 +129,35 @@ def find_solar_return_jd(birth_time_utc, natal_sun_lon, return_year):
         jd_ut += time_adjustment
     return jd_ut
 
+def calculate_house_table(jd_ut, lat, lon, house_systems=(PRIMARY_HOUSE_SYSTEM,)):
+    """ARMCと黄道傾斜角を一度だけ求め、指定された全ハウスシステムのカスプを計算する"""
+    armc = (swe.sidtime(jd_ut) * 15 + lon) % ZODIAC_DEGREES
+    eps = swe.calc_ut(jd_ut, swe.ECL_NUT)[0][0]
+    house_table = {'armc': armc, 'eps': eps, 'ascmc': None, 'cusps': {}, 'fallbacks': {}}
+
+    # 同じシステムを二度計算しないよう、失敗したものも含めて結果を保持する
+    computed = {}
+    for name in house_systems:
+        for candidate in [name] + HOUSE_FALLBACK_ORDER:
+            if candidate not in computed:
+                try:
+                    cusps, ascmc = swe.houses_armc(armc, lat, eps, HOUSE_SYSTEMS[candidate])
+                    computed[candidate] = cusps
+                    if house_table['ascmc'] is None:
+                        house_table['ascmc'] = ascmc
+                except swe.Error:
+                    computed[candidate] = None
+            if computed[candidate] is not None:
+                house_table['cusps'][name] = computed[candidate]
+                if candidate != name:
+                    house_table['fallbacks'][name] = candidate
+                break
+
+    return house_table
+
 # --- 天体データ計算・整形関数 ---
 
-def calculate_celestial_points(jd_ut, lat, lon, is_helio=False):
+def calculate_celestial_points(jd_ut, lat, lon, is_helio=False, house_systems=(PRIMARY_HOUSE_SYSTEM,)):
     """指定されたユリウス日と場所の天体情報を計算して辞書で返す"""
     points = {}
     iflag = swe.FLG_SWIEPH | swe.FLG_SPEED
@@ -143,35 +179,36 @@ def calculate_celestial_points(jd_ut, lat, lon, is_helio=False):
             'is_luminary': p_id in LUMINARIES or (is_helio and p_id == swe.EARTH)
         }
 
-    cusps, ascmc = None, None
+    cusps, house_table = None, None
     if not is_helio:
-        try:
-            cusps, ascmc = swe.houses(jd_ut, lat, lon, b'P')
-            points["ASC"] = {'id': 'ASC', 'pos': ascmc[0], 'is_retro': False, 'speed': 0, 'is_luminary': True}
-            points["MC"] = {'id': 'MC', 'pos': ascmc[1], 'is_retro': False, 'speed': 0, 'is_luminary': True}
-
-            asc_pos = ascmc[0]
-            dsc_pos = (asc_pos + 180) % ZODIAC_DEGREES
-            sun_pos = points["太陽"]['pos']
-            moon_pos = points["月"]['pos']
-
-            is_night_birth = False
-            if asc_pos < dsc_pos:
-                if not (asc_pos <= sun_pos < dsc_pos): is_night_birth = True
-            else:
-                if dsc_pos <= sun_pos < asc_pos: is_night_birth = True
+        house_table = calculate_house_table(jd_ut, lat, lon, house_systems)
+        ascmc = house_table['ascmc']
+        if ascmc is None or PRIMARY_HOUSE_SYSTEM not in house_table['cusps']:
+            st.warning("ハウスが計算できませんでした（高緯度など）。ASC, MC, PoF, ハウスは表示されません。")
+            return points, None, None
 
-            if is_night_birth:
-                pof_pos = (asc_pos + sun_pos - moon_pos + ZODIAC_DEGREES) % ZODIAC_DEGREES
-            else:
-                pof_pos = (asc_pos + moon_pos - sun_pos + ZODIAC_DEGREES) % ZODIAC_DEGREES
-            points["PoF"] = {'id': 'PoF', 'pos': pof_pos, 'is_retro': False, 'speed': 0, 'is_luminary': False}
+        cusps = house_table['cusps'][PRIMARY_HOUSE_SYSTEM]
+        points["ASC"] = {'id': 'ASC', 'pos': ascmc[0], 'is_retro': False, 'speed': 0, 'is_luminary': True}
+        points["MC"] = {'id': 'MC', 'pos': ascmc[1], 'is_retro': False, 'speed': 0, 'is_luminary': True}
 
-        except swe.Error as e:
-            st.warning(f"ハウスが計算できませんでした（高緯度など）。ASC, MC, PoF, ハウスは表示されません。詳細: {e}")
-            return points, None, None
+        asc_pos = ascmc[0]
+        dsc_pos = (asc_pos + 180) % ZODIAC_DEGREES
+        sun_pos = points["太陽"]['pos']
+        moon_pos = points["月"]['pos']
 
-    return points, cusps, ascmc
+        is_night_birth = False
+        if asc_pos < dsc_pos:
+            if not (asc_pos <= sun_pos < dsc_pos): is_night_birth = True
+        else:
+            if dsc_pos <= sun_pos < asc_pos: is_night_birth = True
+
+        if is_night_birth:
+            pof_pos = (asc_pos + sun_pos - moon_pos + ZODIAC_DEGREES) % ZODIAC_DEGREES
+        else:
+            pof_pos = (asc_pos + moon_pos - sun_pos + ZODIAC_DEGREES) % ZODIAC_DEGREES
+        points["PoF"] = {'id': 'PoF', 'pos': pof_pos, 'is_retro': False, 'speed': 0, 'is_luminary': False}
+
+    return points, cusps, house_table
 
 def format_points_to_string_list(points, cusps, title):
     """計算された天体辞書を整形して文字列リストで返す"""
@@ -190,15 +227,22 @@ def format_points_to_string_list(points, cusps, title):
         lines.append(f"{name:<12}: {SIGN_NAMES[sign_index]:<4} {degree:>5.2f}度 {retro_info:<3} {house_info}")
     return lines
 
-def format_houses_to_string_list(cusps, title):
-    """ハウスカスプ情報を整形して文字列リストで返す"""
-    if cusps is None: return []
+def format_houses_to_string_list(house_table, title):
+    """複数ハウスシステムのカスプ情報を一覧表に整形して文字列リストで返す"""
+    if house_table is None or not house_table['cusps']: return []
     lines = [f"\n🏠 ## {title} ##"]
+    system_names = list(house_table['cusps'])
+    lines.append("ハウス    : " + " | ".join(f"{name:<8}" for name in system_names))
     for i in range(12):
-        pos = cusps[i]
-        sign_index = int(pos / DEGREES_PER_SIGN)
-        degree = pos % DEGREES_PER_SIGN
-        lines.append(f"第{i+1:<2}ハウス: {SIGN_NAMES[sign_index]:<4} {degree:.2f}度")
+        cells = []
+        for name in system_names:
+            pos = house_table['cusps'][name][i]
+            sign_index = int(pos / DEGREES_PER_SIGN)
+            degree = pos % DEGREES_PER_SIGN
+            cells.append(f"{SIGN_NAMES[sign_index]:<4}{degree:>5.2f}度")
+        lines.append(f"第{i+1:<2}ハウス: " + " | ".join(cells))
+    for name, used in house_table['fallbacks'].items():
+        lines.append(f"※{name}は計算できないため{used}で代替しています")
     return lines
 
 # --- アスペクト・ハーモニクス計算関数 ---
@@ -550,9 +594,9 @@ if submit_button:
         with st.spinner("ジオセントリック（ネイタル）を計算中..."):
             results_to_copy.append("\n" + "="*40)
             results_to_copy.append("--- ジオセントリック (ネイタル) ---")
-            natal_points, natal_cusps, _ = calculate_celestial_points(jd_ut_natal, lat, lon)
+            natal_points, natal_cusps, natal_houses = calculate_celestial_points(jd_ut_natal, lat, lon, house_systems=HOUSE_SYSTEMS)
             results_to_copy.extend(format_points_to_string_list(natal_points, natal_cusps, "ネイタルチャート"))
-            results_to_copy.extend(format_houses_to_string_list(natal_cusps, "ハウス (ネイタル)"))
+            results_to_copy.extend(format_houses_to_string_list(natal_houses, "ハウス (ネイタル)"))
             calculate_aspects(natal_points, natal_points, "N.", "N.", results_to_copy, natal_cusps, natal_cusps)
 
         # --- 2. ネイタルチャート計算 (ヘリオセントリック) ---
@@ -645,9 +689,9 @@ if submit_button:
                 sr_header = f"🎂 ## {return_year}年 ソーラーリターンチャート ##\n({sr_dt_local.strftime('%Y-%m-%d %H:%M:%S')} @ {sr_location_name})"
                 results_to_copy.append(sr_header)
                 
-                sr_points, sr_cusps, _ = calculate_celestial_points(jd_solar_return_ut, sr_lat, sr_lon)
+                sr_points, sr_cusps, sr_houses = calculate_celestial_points(jd_solar_return_ut, sr_lat, sr_lon, house_systems=HOUSE_SYSTEMS)
                 results_to_copy.extend(format_points_to_string_list(sr_points, sr_cusps, "惑星のサイン (ソーラーリターン)"))
-                results_to_copy.extend(format_houses_to_string_list(sr_cusps, "ハウス (ソーラーリターン)"))
+                results_to_copy.extend(format_houses_to_string_list(sr_houses, "ハウス (ソーラーリターン)"))
                 calculate_aspects(sr_points, sr_points, "SR.", "SR.", results_to_copy, sr_cusps, sr_cusps)
                 calculate_aspects(sr_points, natal_points, "SR.", "N.", results_to_copy, sr_cusps, natal_cusps)
 